@@ -7,7 +7,11 @@ architecture that is easier to test and extend.
 
 from __future__ import annotations
 
+import bisect
+import collections
+import functools
 import random
+import sys
 from dataclasses import dataclass
 from typing import Callable, Iterable, List, Optional, Sequence
 
@@ -45,6 +49,9 @@ BAD_EVENTS: Sequence[str] = (
     "Thorny Brambles",
 )
 
+# Events available on every wave, concatenated once.
+_BASE_EVENTS: tuple[str, ...] = tuple(RANDOM_EVENTS) + tuple(BAD_EVENTS)
+
 BOSS_TITLES: dict[int, str] = {
     5: "Gorecrow",
     10: "Scorch Herald",
@@ -53,7 +60,7 @@ BOSS_TITLES: dict[int, str] = {
     25: "Gravelox",
 }
 
-BOSS_ASCII: dict[int, str] = {
+_RAW_BOSS_ASCII: dict[int, str] = {
     5: "  .-^-.\n (o o)\n  |=|  Scarecrow\n /___\\",
     10: "  /\\\\\n (🔥 )  Scorch\n  \\//",
     15: "  /\\_/\\\n ( o.o )  Rusthorn\n  > ^ <",
@@ -61,6 +68,11 @@ BOSS_ASCII: dict[int, str] = {
     25: "  /\\__/\\\n ( o_o )  Gravelox\n /  _  \\",
 }
 
+# Boss art split into lines once at import so spawns don't re-split it.
+BOSS_ASCII_LINES: dict[int, tuple[str, ...]] = {
+    wave: tuple(art.splitlines()) for wave, art in _RAW_BOSS_ASCII.items()
+}
+
 AREA_RANGES: Sequence[tuple[int, int, str, str]] = (
     (1, 10, "Meadowfront", "Soft grass, warm wind, and a distant scarecrow.") ,
     (11, 20, "Ashen Fields", "The soil is warm to the touch, embers float in the air."),
@@ -74,33 +86,153 @@ WAVE_RANGE_EVENTS: Sequence[tuple[range, Sequence[str]]] = (
     (range(21, 31), ("Gravel Gust", "Rusted Plow")),
 )
 
+# Story beats on boss waves: wave -> (message, follow-up action or None).
+STORY_MESSAGES: dict[int, tuple[str, Optional[str]]] = {
+    5: ("A shadow farmer raids your field. Something darker looms...", None),
+    10: ("A cult called Scorch appears — burning farms across the land.", None),
+    15: ("A rogue survivor teaches you a mysterious skill, before the boss came.", "skill"),
+    20: ("The Emberlord arrives, flames rise around your barn.", None),
+    25: ("You uncover the truth. Will you DEFEND [1] or STRIKE BACK [2]?", "decision"),
+}
+
+# Per-wave area lookup for the finite story areas, expanded once at import. The
+# last area is open-ended (runs to a 9999 sentinel) and is checked directly instead.
+WAVE_TO_AREA: dict[int, tuple[str, str]] = {
+    wave: (name, detail)
+    for start, end, name, detail in AREA_RANGES[:-1]
+    for wave in range(start, end + 1)
+}
+
+# Story waves that never roll a random event.
+STORY_SKIP_WAVES = frozenset({5, 10, 15})
+
+# Sorted range endpoints so wave-event lookups can bisect instead of scanning.
+_WAVE_EVENT_STOPS: tuple[int, ...] = tuple(wave_range.stop for wave_range, _ in WAVE_RANGE_EVENTS)
+
+
+@functools.lru_cache(maxsize=128)
+def _konami_cost(purchase_count: int, extra_tiers: int) -> tuple[int, int]:
+    """Return the (coins, gold) Konami activation price; rises every 3 purchases."""
+    tiers = (purchase_count // 3) + extra_tiers
+    coins = 7 + (tiers * 2)
+    gold = 5 + tiers
+    return coins, gold
+
+
+# Creator's intro: each block is written in one go, then optionally paused on.
+_INTRO_SCRIPT: tuple[tuple[str, Optional[str]], ...] = (
+    ("Oh hey, welcome to this Game thing that I made. ", "[Press Enter to continue the yapping]"),
+    (
+        "This game was actually going to be Dart-based(yes crazy I know).\n"
+        "But it ends up being like this, a Python-based text CLI game.",
+        "[Press Enter to continue the yapping]",
+    ),
+    ("But hey, at least you played this version!", "[Press Enter to continue the yapping]"),
+    (
+        "Feel free to play this game in your own will, or not.\n"
+        "If you're an Anti-AI, then just hop off.",
+        "[Press Enter to continue the yapping]",
+    ),
+    ("Or if you don't really care all that shit, it's up to you.", "[Press Enter to finish yapping]"),
+    ("Have fun. | Creator's Note 1", "[Press Enter to finally finished yapping]"),
+)
+
+_UPDATE_NOTES: tuple[str, ...] = (
+    "- Added a main menu with Start, Creator's Notes, and Update Notes.",
+    "- Preserved the full intro/yapping section cuz y not?",
+    "- Expanded random events and made 'another random event'",
+    "- Added area transitions and story flavor between waves",
+    "- Added Endless Mode, more info when passing Wave 30",
+    "- Shop now includes more upgrades with clearer pricing/limits.",
+    "- Konami fragments last 5 rounds if unused; activations are unlimited.",
+    "- Boss haves names and ASCII art when they appeared!!",
+    "- Fixed damage reduction and Temporary Buff",
+    "- Rebalance Endless mode scaling on further waves",
+    "- Endless enemies now gets rid of ur HP based on your max HP.",
+    "- Lost Cow now shows the shield amount scaled by 3× max HP, y not?",
+    "- Strange Seed and Konami activations now spit out the buff numbers.",
+)
+
+# Accepted main menu inputs.
+_START_CHOICES = frozenset({"1", "start", "s"})
+_NOTES_CHOICES = frozenset({"2", "creator", "creator's notes", "notes", "c"})
+_UPDATE_CHOICES = frozenset({"3", "update", "updates", "u"})
+_YES_ANSWERS = frozenset({"y", "yes"})
+
 
 class IOInterface:
     """Abstract IO layer so the game can be tested without a console."""
 
+    # False for headless/scripted runs: pure "press Enter" pauses are skipped.
+    interactive: bool = True
+
     def write(self, text: str) -> None:
         raise NotImplementedError
 
+    def write_block(self, lines: Iterable[str]) -> None:
+        """Write several lines at once; defaults to a single newline-joined write."""
+        self.write("\n".join(lines))
+
+    def flush(self) -> None:
+        """Push any buffered output to the player. No-op for unbuffered IO."""
+
     def prompt(self, text: str) -> str:
         raise NotImplementedError
 
 
 class ConsoleIO(IOInterface):
-    """Default IO implementation that uses the Python console."""
+    """Default IO implementation that uses the Python console.
+
+    Output is buffered and written to stdout in one go whenever the player is
+    prompted (or ``flush`` is called), instead of once per line.
+    """
+
+    def __init__(self) -> None:
+        self._buf: List[str] = []
 
     def write(self, text: str) -> None:
-        print(text)
+        self._buf.append(text)
+        self._buf.append("\n")
+
+    def write_block(self, lines: Iterable[str]) -> None:
+        self._buf.append("\n".join(lines))
+        self._buf.append("\n")
+
+    def flush(self) -> None:
+        if self._buf:
+            sys.stdout.write("".join(self._buf))
+            self._buf.clear()
+        sys.stdout.flush()
 
     def prompt(self, text: str) -> str:
+        self.flush()
         return input(text)
 
 
+class ScriptedIO(IOInterface):
+    """Headless IO that replays queued inputs and records everything written."""
+
+    def __init__(self, inputs: Iterable[str] = (), interactive: bool = False) -> None:
+        self.inputs: collections.deque[str] = collections.deque(inputs)
+        self.outputs: List[str] = []
+        self.interactive = interactive
+
+    def write(self, text: str) -> None:
+        self.outputs.append(text)
+
+    def prompt(self, text: str) -> str:
+        if not self.inputs:
+            raise EOFError("No scripted input left")
+        return self.inputs.popleft()
+
+
 class KonamiManager:
     """Tracks Konami code input and applies related game bonuses."""
 
     def __init__(self, sequence: Sequence[str], rng: random.Random, max_uses: int = 0) -> None:
-        self.sequence = list(sequence)
-        self.buffer: List[str] = []
+        self.sequence = tuple(sequence)
+        # sliding window of the latest inputs; the deque drops the oldest on overflow
+        self.buffer: collections.deque[str] = collections.deque(maxlen=len(self.sequence))
         self.rng = rng
         self.max_uses = max_uses
         self.uses = 0
@@ -118,18 +250,17 @@ class KonamiManager:
             return False
 
         self.buffer.append(value)
-        if len(self.buffer) > len(self.sequence):
-            self.buffer.pop(0)
+        snap = tuple(self.buffer)
 
         unlimited = self.max_uses <= 0
-        if self.buffer == self.sequence and not self.locked and (unlimited or self.uses < self.max_uses):
+        if snap == self.sequence and not self.locked and (unlimited or self.uses < self.max_uses):
             self.buffer.clear()
             self.uses += 1
             if not unlimited and self.uses >= self.max_uses:
                 self.locked = True
             return True
 
-        if self.buffer != self.sequence[: len(self.buffer)] and self.rng.random() < 0.15:
+        if snap != self.sequence[: len(snap)] and self.rng.random() < 0.15:
             # Provide a gentle hint when the sequence does not match.
             raise KonamiHint(self.rng.choice(self.hints))
 
@@ -143,7 +274,7 @@ class KonamiManager:
         and returns True. Otherwise returns False.
         """
         # normalize
-        tokens = [str(x).lower().strip() for x in inputs]
+        tokens = tuple(str(x).lower().strip() for x in inputs)
         unlimited = self.max_uses <= 0
         if tokens == self.sequence and not self.locked and (unlimited or self.uses < self.max_uses):
             self.uses += 1
@@ -162,14 +293,26 @@ class KonamiHint(RuntimeError):
     """Internal exception to signal that a hint should be shown to the player."""
 
 
+def _percent_of_hp(max_hp: int, percent: float) -> int:
+    """Return ``percent`` of ``max_hp`` rounded to an int, at least 1."""
+    return max(1, round(max_hp * percent))
+
+
 class Farm:
     """Base class shared by the player farm and enemies."""
 
+    __slots__ = ("name", "max_hp", "health", "attack_power", "stunned", "attack_debuff", "last_gimmick_turn")
+
     def __init__(self, name: str, health: int, attack_power: int) -> None:
         self.name = name
         self.max_hp = health
         self.health = health
         self.attack_power = attack_power
+        # transient status effects applied by skills, cleared by the battle loop
+        self.stunned: bool = False
+        self.attack_debuff: float = 0.0
+        # turn of the last endless-mode gimmick triggered by this farm
+        self.last_gimmick_turn: int = -999
 
     @property
     def is_alive(self) -> bool:
@@ -268,10 +411,10 @@ class PlayerFarm(Farm):
         self.health = self.max_hp
 
     def add_new_skill(self, io: Optional[IOInterface] = None) -> None:
-        available = list(self._all_skills())
+        all_skills = self._all_skills()
         # randomize available skills and pick a new one if any
         self.rng = getattr(self, 'rng', random.Random())
-        self.rng.shuffle(available)
+        available = self.rng.sample(all_skills, len(all_skills))
         for skill in available:
             if all(existing.name != skill.name for existing in self.skills):
                 self.skills.append(skill)
@@ -289,51 +432,10 @@ class PlayerFarm(Farm):
         self.health = min(self.max_hp, self.health)
 
     def konami_activation_cost(self, extra_tiers: int = 0) -> tuple[int, int]:
-        tiers = (self.konami_purchase_count // 3) + max(0, extra_tiers)
-        coins = 7 + (tiers * 2)
-        gold = 5 + tiers
-        return coins, gold
-
-    def _all_skills(self) -> Iterable[Skill]:
-        # Reworked skill set: more variety, cooldowns, and attack-power based scaling
-        return (
-            Skill(
-                "Blazing Corn",
-                "Deal 30% of enemy current HP + 30% of your attack power and stun the enemy.",
-                lambda p, e, io: self._skill_blazing_corn(p, e, io),
-                cooldown=4,
-            ),
-            Skill(
-                "Rain Dance",
-                "Restore HP equal to 30% of your max HP + 50% of your attack power.",
-                lambda p, e, io: self._skill_rain_dance_buffed(p, io),
-                cooldown=5,
-            ),
-            Skill(
-                "Stampede",
-                "Strike for 1.3x attack power, reduce enemy next attack, and you take 30% recoil.",
-                lambda p, e, io: self._skill_stampede_buffed(p, e, io),
-                cooldown=5,
-            ),
-            Skill(
-                "Fortify Fence",
-                "Permanently increase max HP by 25.",
-                lambda p, e, io: self._skill_increase_max_hp(p, 25, io),
-                cooldown=9999,  # passive/once-use ultimate-style
-            ),
-            Skill(
-                "Sap Burst",
-                "Deal 0.9x attack power and heal for 12% of your max HP.",
-                lambda p, e, io: self._skill_sap_burst(p, e, io),
-                cooldown=3,
-            ),
-            Skill(
-                "Concussive Seed",
-                "Deal 0.5x attack power and stun the enemy to skip its next turn.",
-                lambda p, e, io: self._skill_concussive_seed(p, e, io),
-                cooldown=4,
-            ),
-        )
+        return _konami_cost(self.konami_purchase_count, max(0, extra_tiers))
+
+    def _all_skills(self) -> Sequence[Skill]:
+        return _ALL_SKILLS
 
     @staticmethod
     def _skill_increase_max_hp(player: "PlayerFarm", amount: int, io: IOInterface) -> None:
@@ -346,7 +448,7 @@ class PlayerFarm(Farm):
     def _skill_blazing_corn(player: "PlayerFarm", enemy: Farm, io: IOInterface) -> None:
         damage = round(enemy.health * 0.3) + round(player.attack_power * 0.3)
         enemy.take_damage(damage)
-        setattr(enemy, 'stunned', True)
+        enemy.stunned = True
         io.write(f"🔥 Blazing Corn deals {damage} damage and stuns {enemy.name} (they skip their next turn)!")
 
     @staticmethod
@@ -360,24 +462,18 @@ class PlayerFarm(Farm):
         damage = round(player.attack_power * 1.3)
         enemy.take_damage(damage)
         # apply a debuff: reduce enemy attack this turn by 30%
-        if hasattr(enemy, 'attack_debuff'):
-            enemy.attack_debuff += 0.3
-        else:
-            setattr(enemy, 'attack_debuff', 0.3)
+        enemy.attack_debuff += 0.3
         # recoil 30% of damage dealt
         recoil = round(damage * 0.3)
         player.take_damage(recoil)
         io.write(f"🐄 Stampede hits {enemy.name} for {damage} damage, you recoil {recoil} HP and reduce their next attack!")
 
-    def _skill_stampede_buffed(self, player: "PlayerFarm", enemy: Farm, io: IOInterface) -> None:
-        return PlayerFarm._skill_stampede(player, enemy, io)
-
     @staticmethod
     def _skill_concussive_seed(player: "PlayerFarm", enemy: Farm, io: IOInterface) -> None:
         damage = round(player.attack_power * 0.5)
         enemy.take_damage(damage)
         # apply stun flag for one turn
-        setattr(enemy, 'stunned', True)
+        enemy.stunned = True
         io.write(f"🌱 Concussive Seed hits for {damage} and stuns {enemy.name}!")
 
     @staticmethod
@@ -388,7 +484,59 @@ class PlayerFarm(Farm):
         io.write(f"🌿 Sap Burst deals {damage} damage and restores {heal} HP.")
 
 
+def _rain_dance_effect(player: PlayerFarm, enemy: Farm, io: IOInterface) -> None:
+    PlayerFarm._skill_rain_dance_buffed(player, io)
+
+
+def _fortify_fence_effect(player: PlayerFarm, enemy: Farm, io: IOInterface) -> None:
+    PlayerFarm._skill_increase_max_hp(player, 25, io)
+
+
+# Reworked skill set: more variety, cooldowns, and attack-power based scaling.
+# Built once at import since the skills are static and shared by every player.
+_ALL_SKILLS: tuple[Skill, ...] = (
+    Skill(
+        "Blazing Corn",
+        "Deal 30% of enemy current HP + 30% of your attack power and stun the enemy.",
+        PlayerFarm._skill_blazing_corn,
+        cooldown=4,
+    ),
+    Skill(
+        "Rain Dance",
+        "Restore HP equal to 30% of your max HP + 50% of your attack power.",
+        _rain_dance_effect,
+        cooldown=5,
+    ),
+    Skill(
+        "Stampede",
+        "Strike for 1.3x attack power, reduce enemy next attack, and you take 30% recoil.",
+        PlayerFarm._skill_stampede,
+        cooldown=5,
+    ),
+    Skill(
+        "Fortify Fence",
+        "Permanently increase max HP by 25.",
+        _fortify_fence_effect,
+        cooldown=9999,  # passive/once-use ultimate-style
+    ),
+    Skill(
+        "Sap Burst",
+        "Deal 0.9x attack power and heal for 12% of your max HP.",
+        PlayerFarm._skill_sap_burst,
+        cooldown=3,
+    ),
+    Skill(
+        "Concussive Seed",
+        "Deal 0.5x attack power and stun the enemy to skip its next turn.",
+        PlayerFarm._skill_concussive_seed,
+        cooldown=4,
+    ),
+)
+
+
 class Monster(Farm):
+    __slots__ = ()
+
     def __init__(self, wave: int) -> None:
         super().__init__(
             name="Enemy Monster",
@@ -399,6 +547,8 @@ class Monster(Farm):
 
 
 class Boss(Monster):
+    __slots__ = ("passive_reward",)
+
     def __init__(self, wave: int) -> None:
         super().__init__(wave)
         title = BOSS_TITLES.get(wave)
@@ -426,6 +576,129 @@ class Boss(Monster):
             True,
         )
 
+
+def _shop_tonic(player: PlayerFarm, turns: int, reduction: float) -> None:
+    player.tonic_turns = turns
+    player.tonic_reduction = reduction
+
+
+def _shop_attack_buff(player: PlayerFarm, buff: int) -> None:
+    player.attack_power += buff
+    player.temp_attack_bonus += buff
+
+
+def _shop_gold(player: PlayerFarm, amount: int) -> None:
+    player.gold += amount
+
+
+def _shop_seed(player: PlayerFarm, attack: int, hp: int) -> None:
+    player.attack_power += attack
+    player.max_hp += hp
+    player.health = min(player.health + hp, player.max_hp)
+
+
+def _tonic_active(player: PlayerFarm) -> bool:
+    return player.tonic_turns > 0
+
+
+@dataclass(frozen=True)
+class ShopItem:
+    name: str
+    currency: str  # "coins" or "gold"
+    cost: int
+    summary: str
+    buy: Callable[[PlayerFarm], None]
+    message: str
+    # purchase is refused while this returns True (e.g. the item is still in effect)
+    blocked_if: Optional[Callable[[PlayerFarm], bool]] = None
+
+    def menu_line(self, key: str) -> str:
+        return f"[{key}] {self.name} ({self.cost} {self.currency}) - {self.summary}"
+
+
+STORY_SHOP: dict[str, ShopItem] = {
+    "1": ShopItem(
+        "Field Tonic",
+        "coins",
+        8,
+        "reduce incoming damage by 30% for 3 turns",
+        functools.partial(_shop_tonic, turns=3, reduction=0.30),
+        "You apply a Field Tonic, reducing incoming damage by 30% for 3 turns.",
+        blocked_if=_tonic_active,
+    ),
+    "2": ShopItem(
+        "Attack Tonic",
+        "coins",
+        6,
+        "+12 attack for this wave",
+        functools.partial(_shop_attack_buff, buff=12),
+        "You drink the Attack Tonic. Attack +12 for this wave.",
+    ),
+    "3": ShopItem(
+        "Gold Pouch",
+        "coins",
+        10,
+        "gain 1 gold",
+        functools.partial(_shop_gold, amount=1),
+        "You purchase a Gold Pouch and gain 1 gold.",
+    ),
+    "4": ShopItem(
+        "Blessed Seed",
+        "gold",
+        1,
+        "permanently +3 attack and +10 max HP",
+        functools.partial(_shop_seed, attack=3, hp=10),
+        "You plant the Blessed Seed. Attack and Max HP permanently increased.",
+    ),
+}
+
+ENDLESS_SHOP: dict[str, ShopItem] = {
+    "1": ShopItem(
+        "Ironbark Brew",
+        "coins",
+        10,
+        "reduce incoming damage by 45% for 2 turns",
+        functools.partial(_shop_tonic, turns=2, reduction=0.45),
+        "You drink an Ironbark Brew. Damage reduced by 45% for 2 turns.",
+        blocked_if=_tonic_active,
+    ),
+    "2": ShopItem(
+        "War Banner",
+        "coins",
+        12,
+        "+20 attack for this wave",
+        functools.partial(_shop_attack_buff, buff=20),
+        "You raise a War Banner in spirit. Attack +20 for this wave.",
+    ),
+    "3": ShopItem(
+        "Golden Relic",
+        "coins",
+        15,
+        "gain 2 gold",
+        functools.partial(_shop_gold, amount=2),
+        "You purchase a Golden Relic and gain 2 gold.",
+    ),
+    "4": ShopItem(
+        "Ancient Seed",
+        "gold",
+        2,
+        "permanently +8 attack and +20 max HP",
+        functools.partial(_shop_seed, attack=8, hp=20),
+        "You plant an Ancient Seed. Attack and Max HP surge permanently.",
+    ),
+}
+
+
+def _shop_menu(items: dict[str, ShopItem]) -> tuple[str, ...]:
+    header = "\n🏪 The traveling shop appears! You may buy items:"
+    return (header, *(item.menu_line(key) for key, item in items.items()))
+
+
+# Static part of the shop menu, generated from the item tables above.
+SHOP_MENU_STORY = _shop_menu(STORY_SHOP)
+SHOP_MENU_ENDLESS = _shop_menu(ENDLESS_SHOP)
+
+
 class Game:
     def __init__(
         self,
@@ -434,9 +707,19 @@ class Game:
     ) -> None:
         self.io = io or ConsoleIO()
         self.rng = rng or random.Random()
+        # pre-bound RNG methods for the per-turn and per-event hot paths
+        self._rand = self.rng.random
+        self._randint = self.rng.randint
+        self._randrange = self.rng.randrange
         self.wave = 1
         self.konami_manager = KonamiManager(KONAMI_SEQUENCE, rng=self.rng)
+        # events already fired in the current cycle; reset once the current pool is exhausted
         self.used_events: set[str] = set()
+        # (wave, pool) for the last computed event pool
+        self._event_pool_cache: Optional[tuple[int, list[str]]] = None
+        # base percent -> scaled percent, valid for the (wave, endless_mode) in the key
+        self._scaled_cache_key: Optional[tuple[int, bool]] = None
+        self._scaled_cache: dict[float, float] = {}
         self.player: Optional[PlayerFarm] = None
         self.turn_count = 0
         self.endless_mode = False
@@ -444,63 +727,21 @@ class Game:
         self.stop_requested = False
 
     def start(self) -> None:
-        self.io.write("Oh hey, welcome to this Game thing that I made. ")
-        input("[Press Enter to continue the yapping]")
-        self.io.write("This game was actually going to be Dart-based(yes crazy I know).")
-        self.io.write("But it ends up being like this, a Python-based text CLI game.")
-        input("[Press Enter to continue the yapping]")
-        self.io.write("But hey, at least you played this version!")
-        input("[Press Enter to continue the yapping]")
-        self.io.write("Feel free to play this game in your own will, or not.")
-        self.io.write("If you're an Anti-AI, then just hop off.")
-        input("[Press Enter to continue the yapping]")
-        self.io.write("Or if you don't really care all that shit, it's up to you.")
-        input("[Press Enter to finish yapping]")
-        self.io.write("Have fun. | Creator's Note 1")
-        input("[Press Enter to finally finished yapping]")
+        self._play_intro()
         while True:
-            self.io.write("\n=== Main Menu ===")
-            self.io.write("1) Start")
-            self.io.write("2) Creator's notes")
-            self.io.write("3) Update notes")
+            self.io.write("\n=== Main Menu ===\n1) Start\n2) Creator's notes\n3) Update notes")
             choice = (self.io.prompt("Choose an option: ") or "").strip().lower()
-            if choice in {"1", "start", "s"}:
+            if choice in _START_CHOICES:
                 break
-            if choice in {"2", "creator", "creator's notes", "notes", "c"}:
+            if choice in _NOTES_CHOICES:
                 self.io.write("\nCreator's Notes:")
-                self.io.write("Oh hey, welcome to this Game thing that I made. ")
-                input("[Press Enter to continue the yapping]")
-                self.io.write("This game was actually going to be Dart-based(yes crazy I know).")
-                self.io.write("But it ends up being like this, a Python-based text CLI game.")
-                input("[Press Enter to continue the yapping]")
-                self.io.write("But hey, at least you played this version!")
-                input("[Press Enter to continue the yapping]")
-                self.io.write("Feel free to play this game in your own will, or not.")
-                self.io.write("If you're an Anti-AI, then just hop off.")
-                input("[Press Enter to continue the yapping]")
-                self.io.write("Or if you don't really care all that shit, it's up to you.")
-                input("[Press Enter to finish yapping]")
-                self.io.write("Have fun. | Creator's Note 1")
-                input("[Press Enter to finally finished yapping]")
+                self._play_intro()
                 continue
-            if choice in {"3", "update", "updates", "u"}:
-                self.io.write("\nUpdate Notes: V0.10 | Alpha")
-                self.io.write("- Added a main menu with Start, Creator's Notes, and Update Notes.")
-                self.io.write("- Preserved the full intro/yapping section cuz y not?")
-                self.io.write("- Expanded random events and made 'another random event'")
-                self.io.write("- Added area transitions and story flavor between waves")
-                self.io.write("- Added Endless Mode, more info when passing Wave 30")
-                self.io.write("- Shop now includes more upgrades with clearer pricing/limits.")
-                self.io.write("- Konami fragments last 5 rounds if unused; activations are unlimited.")
-                self.io.write("- Boss haves names and ASCII art when they appeared!!")
-                self.io.write("- Fixed damage reduction and Temporary Buff")
-                self.io.write("- Rebalance Endless mode scaling on further waves")
-                self.io.write("- Endless enemies now gets rid of ur HP based on your max HP.")
-                self.io.write("- Lost Cow now shows the shield amount scaled by 3× max HP, y not?")
-                self.io.write("- Strange Seed and Konami activations now spit out the buff numbers.")
-                input("[Press Enter to go back.]")
+            if choice in _UPDATE_CHOICES:
+                self.io.write("\n".join(("\nUpdate Notes: V0.10 | Alpha",) + _UPDATE_NOTES))
+                self._pause("[Press Enter to go back.]")
                 continue
-            input("Just pick anything bro dont mess this one up🥀")
+            self._pause("Just pick anything bro dont mess this one up🥀")
         self.io.write("You might want to extend your terminal a bit if you're playing with one.")
         name = self.io.prompt("Enter your Farm name: ") or "Farm"
         self.player = PlayerFarm(name)
@@ -518,6 +759,7 @@ class Game:
                 self.wave += 1
         except KeyboardInterrupt:
             self.io.write("\n👋 Thanks for playing! Try again if you want.")
+            self.io.flush()
             return
 
         if self.stop_requested and self.player.is_alive:
@@ -525,6 +767,18 @@ class Game:
         else:
             self.io.write(f"\n💀 {self.player.name} has fallen at wave {self.wave}.")
             self.io.write("🌾 Thanks for playing!")
+        self.io.flush()
+
+    def _play_intro(self) -> None:
+        for line, pause in _INTRO_SCRIPT:
+            self.io.write(line)
+            if pause:
+                self._pause(pause)
+
+    def _pause(self, text: str) -> None:
+        # press-Enter pause; headless runs skip it
+        if self.io.interactive:
+            self.io.prompt(text)
 
     def _play_wave(self) -> None:
         assert self.player is not None
@@ -549,10 +803,9 @@ class Game:
         self.io.write(f"\n=== Wave {self.wave} ===")
         self._story_arc(self.wave)
         if isinstance(enemy, Boss):
-            art = BOSS_ASCII.get(self.wave)
+            art = BOSS_ASCII_LINES.get(self.wave)
             if art:
-                for line in art.splitlines():
-                    self.io.write(line)
+                self.io.write("\n".join(art))
         # shop every 2 waves
         if self.wave % 2 == 0:
             self._open_shop()
@@ -571,6 +824,7 @@ class Game:
 
     def _battle(self, enemy: Farm) -> None:
         assert self.player is not None
+        is_boss = isinstance(enemy, Boss)
         # battle loop with cooldown ticking and turn limits
         self.turn_count = 0
         long_battle_threshold = 10
@@ -578,28 +832,21 @@ class Game:
         while self.player.is_alive and enemy.is_alive:
             self.turn_count += 1
             # increase enemy scaling if battle goes too long
-            if self.turn_count >= long_battle_threshold and not isinstance(enemy, Boss):
+            if self.turn_count >= long_battle_threshold and not is_boss:
                 # scale by 1.5x
-                enemy.attack_power = int(enemy.attack_power * 1.5)
+                enemy.attack_power = enemy.attack_power * 3 // 2
                 self.io.write(f"⚠️ The enemy is getting Stronger by the turn!")
-            if self.turn_count >= boss_threshold and isinstance(enemy, Boss):
-                enemy.attack_power = int(enemy.attack_power * 1.5)
+            if self.turn_count >= boss_threshold and is_boss:
+                enemy.attack_power = enemy.attack_power * 3 // 2
                 self.io.write(f"⚠️ The boss's getting impatient, it gets Stronger!")
 
-            # show status
-            self.io.write(
-                f"\n{self.player.name}: {self.player.display_hp()} | "
-                f"{enemy.name}: {enemy.display_hp()} | Coins: {self.player.coins}"
-            )
-
-            # tick down cooldowns
-            for k in list(self.player.skill_cooldowns.keys()):
-                if self.player.skill_cooldowns[k] > 0:
-                    self.player.skill_cooldowns[k] -= 1
-                    if self.player.skill_cooldowns[k] == 0:
-                        del self.player.skill_cooldowns[k]
+            # tick down cooldowns in place; expired entries stay at 0 until the wave ends
+            cds = self.player.skill_cooldowns
+            for k in cds:
+                if cds[k] > 0:
+                    cds[k] -= 1
 
-            # in-battle actions
+            # show status and in-battle actions
             self._show_options(enemy)
 
             if self.endless_mode and enemy.is_alive:
@@ -608,17 +855,17 @@ class Game:
             # enemy action
             if enemy.is_alive:
                 # handle stun
-                if getattr(enemy, 'stunned', False):
+                if enemy.stunned:
                     self.io.write(f"{enemy.name} got stunned and can't act this turn!")
-                    delattr(enemy, 'stunned')
+                    enemy.stunned = False
                 else:
                     # apply any attack debuff
-                    debuff = getattr(enemy, 'attack_debuff', 0)
+                    debuff = enemy.attack_debuff
                     base = enemy.roll_attack_damage(self.rng)
                     actual = max(0, int(base * (1 - debuff))) if debuff else base
                     if debuff:
                         # reset debuff after used
-                        enemy.attack_debuff = 0
+                        enemy.attack_debuff = 0.0
                     # apply player tonic reduction if active
                     if self.player.tonic_turns > 0 and self.player.tonic_reduction > 0:
                         reduced = int(actual * (1 - self.player.tonic_reduction))
@@ -632,11 +879,11 @@ class Game:
 
             # check death to award coins
             if not enemy.is_alive:
-                reward = 6 if not isinstance(enemy, Boss) else 15
+                reward = 6 if not is_boss else 15
                 self.player.coins += reward
                 self.io.write(f"🎉 You defeated {enemy.name}! Coins +{reward} (Total: {self.player.coins})")
                 # Boss gives passive choice
-                if isinstance(enemy, Boss):
+                if is_boss:
                     # guaranteed konami fragment drop if player has less than 3
                     if self.player.konami_fragments < 3:
                         self.player.konami_fragments += 1
@@ -644,9 +891,16 @@ class Game:
                         self.io.write("Konami Fragment Obtained from the Boss!")
                     self._offer_boss_passive(enemy)
 
+        # prune expired cooldowns once the battle is over
+        self.player.skill_cooldowns = {k: v for k, v in self.player.skill_cooldowns.items() if v > 0}
+
     def _show_options(self, enemy: Farm) -> None:
         assert self.player is not None
-        self.io.write("Choose action: [1] Attack  [2] Heal  [3] Skill")
+        self.io.write(
+            f"\n{self.player.name}: {self.player.display_hp()} | "
+            f"{enemy.name}: {enemy.display_hp()} | Coins: {self.player.coins}\n"
+            "Choose action: [1] Attack  [2] Heal  [3] Skill"
+        )
         choice = self.io.prompt("> ").strip()
 
         if choice == "1":
@@ -668,11 +922,12 @@ class Game:
             self.io.write("You have no skills yet, so you just emoted lolz")
             return
 
-        self.io.write("Available Skills:")
+        lines = ["Available Skills:"]
         for idx, skill in enumerate(self.player.skills, start=1):
             cd = self.player.skill_cooldowns.get(skill.name, 0)
             cd_text = f" (CD: {cd})" if cd else ""
-            self.io.write(f"{idx}. {skill.name} — {skill.description}{cd_text}")
+            lines.append(f"{idx}. {skill.name} — {skill.description}{cd_text}")
+        self.io.write("\n".join(lines))
 
         try:
             index_raw = self.io.prompt("Choose a skill: ").strip()
@@ -684,9 +939,8 @@ class Game:
         if 0 <= index < len(self.player.skills):
             skill = self.player.skills[index]
             # check cooldown
-            if skill.name in self.player.skill_cooldowns and self.player.skill_cooldowns[skill.name] > 0:
-                self.io.write(f"{skill.name} is on cd for {self.player.skill_cooldowns[skill.name]} more turns.")
-                self.io.write("Be patience, jeez.")
+            if self.player.skill_cooldowns.get(skill.name, 0) > 0:
+                self.io.write(f"{skill.name} is on cd for {self.player.skill_cooldowns[skill.name]} more turns.\nBe patience, jeez.")
                 return
             # use skill
             skill.use(self.player, enemy, self.io)
@@ -716,15 +970,15 @@ class Game:
         if name == "Ember's Fury":
             self.player.attack_power += 5
         # 20% chance to immediately grant +1 extra stack if available (but not on first acquisition)
-        if stackable and initial_stacks > 0 and stacks < 3 and self.rng.random() < 0.2:
+        if stackable and initial_stacks > 0 and stacks < 3 and self._rand() < 0.2:
             stacks = min(3, stacks + 1)
             self.player.passives[name] = (stacks, stackable)
             if name == "Ember's Fury":
                 self.player.attack_power += 5
             self.io.write("A surge amplifies the reward! An extra stack is granted.")
         # 10% chance small backlash
-        if self.rng.random() < 0.10:
-            lost = max(1, int(self.player.max_hp * 0.05))
+        if self._rand() < 0.10:
+            lost = max(1, self.player.max_hp * 5 // 100)
             self.player.take_damage(lost)
             self.io.write(f"The passive leaves a bitter aftertaste. You lose {lost} HP.")
         self.io.write(f"Passive applied. Current stacks: {stacks}.")
@@ -733,253 +987,218 @@ class Game:
         assert self.player is not None
         if wave % 5 == 0:
             self.io.write(f"\n📜 STORY ARC [{wave}]")
-            if wave == 5:
-                self.io.write("A shadow farmer raids your field. Something darker looms...")
-            elif wave == 10:
-                self.io.write("A cult called Scorch appears — burning farms across the land.")
-            elif wave == 15:
-                self.io.write("A rogue survivor teaches you a mysterious skill, before the boss came.")
-                self.player.add_new_skill(self.io)
-            elif wave == 20:
-                self.io.write("The Emberlord arrives, flames rise around your barn.")
-            elif wave == 25:
-                self.io.write("You uncover the truth. Will you DEFEND [1] or STRIKE BACK [2]?")
-                decision = self.io.prompt("> ").strip()
-                if decision == "1":
-                    self.player.defensive_path = True
-                    self.io.write("You fortify your land. Defense increased!")
-                    self.player.defense_boost()
-                else:
-                    self.io.write("You prepare to counterattack! Attack increased!")
-                    self.player.attack_boost()
+            entry = STORY_MESSAGES.get(wave)
+            if entry:
+                message, action = entry
+                self.io.write(message)
+                if action == "skill":
+                    self.player.add_new_skill(self.io)
+                elif action == "decision":
+                    decision = self.io.prompt("> ").strip()
+                    if decision == "1":
+                        self.player.defensive_path = True
+                        self.io.write("You fortify your land. Defense increased!")
+                        self.player.defense_boost()
+                    else:
+                        self.io.write("You prepare to counterattack! Attack increased!")
+                        self.player.attack_boost()
 
         # Trigger random events on every 3rd wave, except at specific story marks
         if wave > 1 and wave % 3 == 0:
-            if wave in (5, 10, 15):
+            if wave in STORY_SKIP_WAVES:
                 return
             self._trigger_random_event()
 
     def _enter_area_if_needed(self) -> None:
-        for start, end, name, detail in AREA_RANGES:
-            if start <= self.wave <= end:
-                if self.current_area != name:
-                    self.current_area = name
-                    self.io.write(f"\n🗺️ Area: {name}")
-                    self.io.write(detail)
-                    _ = self.io.prompt("Press Enter to continue...")
+        entry = WAVE_TO_AREA.get(self.wave)
+        if entry is not None:
+            name, detail = entry
+        else:
+            start, end, name, detail = AREA_RANGES[-1]
+            if not start <= self.wave <= end:
                 return
+        if self.current_area != name:
+            self.current_area = name
+            self.io.write(f"\n🗺️ Area: {name}\n{detail}")
+            if self.io.interactive:
+                _ = self.io.prompt("Press Enter to continue...")
 
     def _prompt_endless_mode(self) -> bool:
-        self.io.write("\n📣 Story complete. Endless Mode is available!")
-        self.io.write("Changes ahead:")
-        self.io.write("- Enemies scale harder every wave.")
-        self.io.write("- Shop items upgrade to end-game versions.")
-        self.io.write("- Random events expand and can chain.")
-        self.io.write("- Endless foes now siphon a sliver of your max HP each turn.")
-        self.io.write("Choose to continue or completely stop.")
+        self.io.write(
+            "\n📣 Story complete. Endless Mode is available!\n"
+            "Changes ahead:\n"
+            "- Enemies scale harder every wave.\n"
+            "- Shop items upgrade to end-game versions.\n"
+            "- Random events expand and can chain.\n"
+            "- Endless foes now siphon a sliver of your max HP each turn.\n"
+            "Choose to continue or completely stop."
+        )
         answer = (self.io.prompt("Enter Endless Mode? (y/n): ") or "n").strip().lower()
-        return answer in ("y", "yes")
+        return answer in _YES_ANSWERS
 
     def _open_shop(self) -> None:
         assert self.player is not None
+        p = self.player
+        write = self.io.write
+        prompt = self.io.prompt
+        rand = self._rand
+        endless = self.endless_mode
+        extra_tiers = 1 if endless else 0
+        menu = SHOP_MENU_ENDLESS if endless else SHOP_MENU_STORY
+        shop = ENDLESS_SHOP if endless else STORY_SHOP
+        # rebuilt only when the Konami price may have changed (after an activation)
+        menu_lines: Optional[tuple[str, ...]] = None
         # loop shop until the player chooses to leave
         while True:
-            extra_tiers = 1 if self.endless_mode else 0
-            coins_cost, gold_cost = self.player.konami_activation_cost(extra_tiers)
-            self.io.write("\n🏪 The traveling shop appears! You may buy items:")
-            if self.endless_mode:
-                self.io.write("[1] Ironbark Brew (10 coins) - reduce incoming damage by 45% for 2 turns")
-                self.io.write("[2] War Banner (12 coins) - +20 attack for this wave")
-                self.io.write("[3] Golden Relic (15 coins) - gain 2 gold")
-                self.io.write("[4] Ancient Seed (2 gold) - permanently +8 attack and +20 max HP")
-            else:
-                self.io.write("[1] Field Tonic (8 coins) - reduce incoming damage by 30% for 3 turns")
-                self.io.write("[2] Attack Tonic (6 coins) - +12 attack for this wave")
-                self.io.write("[3] Gold Pouch (pay 10 coins) - gain 1 gold")
-                self.io.write("[4] Blessed Seed (1 gold) - permanently +3 attack and +10 max HP")
-            self.io.write(f"[5] Activate Konami Fragment ({gold_cost} gold + {coins_cost} coins)")
-            self.io.write("[6] Leave")
-            choice = self.io.prompt("> ").strip()
-            if choice == "1":
-                if self.player.tonic_turns > 0:
-                    self.io.write("This item is still in effect, buy a different one.")
-                else:
-                    if self.endless_mode:
-                        if self.player.coins >= 10:
-                            self.player.coins -= 10
-                            self.player.tonic_turns = 2
-                            self.player.tonic_reduction = 0.45
-                            self.io.write("You drink an Ironbark Brew. Damage reduced by 45% for 2 turns.")
-                        else:
-                            self.io.write("Not enough coins.")
-                    else:
-                        if self.player.coins >= 8:
-                            self.player.coins -= 8
-                            self.player.tonic_turns = 3
-                            self.player.tonic_reduction = 0.30
-                            self.io.write("You apply a Field Tonic, reducing incoming damage by 30% for 3 turns.")
-                        else:
-                            self.io.write("Not enough coins.")
-                    self.io.write(f"Coins: {self.player.coins} | Gold: {self.player.gold}")
-            elif choice == "2":
-                cost = 12 if self.endless_mode else 6
-                buff = 20 if self.endless_mode else 12
-                if self.player.coins >= cost:
-                    self.player.coins -= cost
-                    self.player.attack_power += buff
-                    self.player.temp_attack_bonus += buff
-                    if self.endless_mode:
-                        self.io.write(f"You raise a War Banner in spirit. Attack +{buff} for this wave.")
-                    else:
-                        self.io.write(f"You drink the Attack Tonic. Attack +{buff} for this wave.")
-                    self.io.write(f"Coins: {self.player.coins} | Gold: {self.player.gold}")
-                else:
-                    self.io.write("Not enough coins.")
-            elif choice == "3":
-                if self.endless_mode:
-                    if self.player.coins >= 15:
-                        self.player.coins -= 15
-                        self.player.gold += 2
-                        self.io.write("You purchase a Golden Relic and gain 2 gold.")
-                        self.io.write(f"Coins: {self.player.coins} | Gold: {self.player.gold}")
-                    else:
-                        self.io.write("Not enough coins.")
-                else:
-                    if self.player.coins >= 10:
-                        self.player.coins -= 10
-                        self.player.gold += 1
-                        self.io.write("You purchase a Gold Pouch and gain 1 gold.")
-                        self.io.write(f"Coins: {self.player.coins} | Gold: {self.player.gold}")
-                    else:
-                        self.io.write("Not enough coins.")
-            elif choice == "4":
-                if self.endless_mode:
-                    if self.player.gold >= 2:
-                        self.player.gold -= 2
-                        self.player.attack_power += 8
-                        self.player.max_hp += 20
-                        self.player.health = min(self.player.health + 20, self.player.max_hp)
-                        self.io.write("You plant an Ancient Seed. Attack and Max HP surge permanently.")
-                        self.io.write(f"Coins: {self.player.coins} | Gold: {self.player.gold}")
-                    else:
-                        self.io.write("Not enough gold.")
-                        if not self.player.gold_tip_shown:
-                            self.io.write("Tip: Buy a Gold Pouch with coins to get gold.")
-                            self.player.gold_tip_shown = True
-                else:
-                    # spend gold for a Blessed Seed
-                    if self.player.gold >= 1:
-                        self.player.gold -= 1
-                        self.player.attack_power += 3
-                        self.player.max_hp += 10
-                        self.player.health = min(self.player.health + 10, self.player.max_hp)
-                        self.io.write("You plant the Blessed Seed. Attack and Max HP permanently increased.")
-                        self.io.write(f"Coins: {self.player.coins} | Gold: {self.player.gold}")
-                    else:
-                        self.io.write("Not enough gold.")
-                        if not self.player.gold_tip_shown:
-                            self.io.write("Tip: Buy a Gold Pouch with coins to get gold.")
-                            self.player.gold_tip_shown = True
+            if menu_lines is None:
+                coins_cost, gold_cost = p.konami_activation_cost(extra_tiers)
+                menu_lines = (
+                    *menu,
+                    f"[5] Activate Konami Fragment ({gold_cost} gold + {coins_cost} coins)",
+                    "[6] Leave",
+                )
+            self.io.write_block(menu_lines)
+            choice = prompt("> ").strip()
+            item = shop.get(choice)
+            if item is not None:
+                self._buy_shop_item(item)
             elif choice == "5":
-                if self.player.konami_fragments > 0:
+                if p.konami_fragments > 0:
                     # require gold + coins to attempt activation
-                    if self.player.gold < gold_cost or self.player.coins < coins_cost:
-                        self.io.write(f"Activating a fragment costs {gold_cost} gold and {coins_cost} coins. You don't have enough resources.")
-                        if not self.player.gold_tip_shown:
-                            self.io.write("Tip: Buy a Gold Pouch with coins to get gold.")
-                            self.player.gold_tip_shown = True
+                    if p.gold < gold_cost or p.coins < coins_cost:
+                        write(f"Activating a fragment costs {gold_cost} gold and {coins_cost} coins. You don't have enough resources.")
+                        if not p.gold_tip_shown:
+                            write("Tip: Buy a Gold Pouch with coins to get gold.")
+                            p.gold_tip_shown = True
                     else:
-                        self.io.write("Enter the Konami sequence tokens separated by spaces (e.g. 'up up down ...'):")
-                        seq = self.io.prompt("> ").strip()
+                        write("Enter the Konami sequence tokens separated by spaces (e.g. 'up up down ...'):")
+                        seq = prompt("> ").strip()
                         tokens = seq.split()
                         if self.konami_manager.check_sequence(tokens):
                             # consume fragment
-                            self.player.konami_fragments -= 1
-                            self.player.gold -= gold_cost
-                            self.player.coins -= coins_cost
-                            self.player.konami_purchase_count += 1
-                            self.io.write("The Konami Fragment glows and releases power into you & your farm!")
+                            p.konami_fragments -= 1
+                            p.gold -= gold_cost
+                            p.coins -= coins_cost
+                            p.konami_purchase_count += 1
+                            menu_lines = None
+                            write("The Konami Fragment glows and releases power into you & your farm!")
                             # smaller buff: +30% of stats but in flat increases
-                            atk_buff = max(1, int(self.player.attack_power * 0.3))
-                            hp_buff = max(1, int(self.player.max_hp * 0.3))
-                            self.player.attack_power += atk_buff
-                            self.player.max_hp += hp_buff
-                            self.player.health += hp_buff
-                            self.player.add_new_skill(self.io)
-                            self.io.write(f"Stats surge: Attack +{atk_buff}, Max HP +{hp_buff} (health +{hp_buff}).")
-                            self.io.write(f"Coins: {self.player.coins} | Gold: {self.player.gold}")
+                            atk_buff = max(1, p.attack_power * 3 // 10)
+                            hp_buff = max(1, p.max_hp * 3 // 10)
+                            p.attack_power += atk_buff
+                            p.max_hp += hp_buff
+                            p.health += hp_buff
+                            p.add_new_skill(self.io)
+                            write(f"Stats surge: Attack +{atk_buff}, Max HP +{hp_buff} (health +{hp_buff}).")
+                            write(f"Coins: {p.coins} | Gold: {p.gold}")
                         else:
-                            self.io.write("The sequence fizzles. The fragment resists activation.")
+                            write("The sequence fizzles. The fragment resists activation.")
                             # failed activations have a small chance to break the fragment
-                            if self.rng.random() < 0.25:
-                                self.player.konami_fragments = max(0, self.player.konami_fragments - 1)
-                                self.io.write("Your fragment breaks, due to failed attempt.")
+                            if rand() < 0.25:
+                                p.konami_fragments = max(0, p.konami_fragments - 1)
+                                write("Your fragment breaks, due to failed attempt.")
                 else:
-                    self.io.write("You don't have one.")
+                    write("You don't have one.")
             elif choice == "6":
-                self.io.write("You leave the shop.")
+                write("You leave the shop.")
                 break
             else:
                 # invalid option returns to shop menu
-                self.io.write("LOL what are you trying to do??")
+                write("LOL what are you trying to do??")
 
-    def _trigger_random_event(self) -> None:
+    def _buy_shop_item(self, item: ShopItem) -> None:
         assert self.player is not None
-        events = self._event_pool()
-
-        if len(self.used_events) == len(events):
-            self.used_events.clear()
+        p = self.player
+        write = self.io.write
+        if item.blocked_if is not None and item.blocked_if(p):
+            write("This item is still in effect, buy a different one.")
+            return
+        if item.currency == "gold":
+            if p.gold < item.cost:
+                write("Not enough gold.")
+                if not p.gold_tip_shown:
+                    write("Tip: Buy a Gold Pouch with coins to get gold.")
+                    p.gold_tip_shown = True
+                return
+            p.gold -= item.cost
+        else:
+            if p.coins < item.cost:
+                write("Not enough coins.")
+                return
+            p.coins -= item.cost
+        item.buy(p)
+        write(item.message)
+        write(f"Coins: {p.coins} | Gold: {p.gold}")
 
-        remaining = [event for event in events if event not in self.used_events]
-        chosen = self.rng.choice(remaining)
-        self.used_events.add(chosen)
-        trigger_used = {chosen}
+    def _trigger_random_event(self) -> None:
+        assert self.player is not None
+        write = self.io.write
+        chosen = self._draw_event()
 
-        self.io.write(f"\n✨ Random Event: {chosen}!")
+        write(f"\n✨ Random Event: {chosen}!")
         self._apply_event(chosen)
 
-        if self.rng.random() < 0.18:
-            self.io.write("\n✨ Huh? Another Random Event?!")
-            extra_events = self._event_pool()
-            extra_events = [event for event in extra_events if event not in trigger_used]
-            if not extra_events:
-                extra_events = self._event_pool()
-            extra = self.rng.choice(extra_events)
-            self.used_events.add(extra)
-            trigger_used.add(extra)
-            self.io.write(f"✨ Random Event: {extra}!")
+        if self._rand() < 0.18:
+            write("\n✨ Huh? Another Random Event?!")
+            extra = self._draw_event(exclude=chosen)
+            write(f"✨ Random Event: {extra}!")
             self._apply_event(extra)
 
+    def _draw_event(self, exclude: Optional[str] = None) -> str:
+        # only the current wave's pool is eligible, so wave-range events stay in their area
+        events = self._event_pool()
+        used = self.used_events
+        remaining = [event for event in events if event not in used]
+        if not remaining:
+            # every event in the pool has fired: start a new cycle, skipping `exclude`
+            used.clear()
+            remaining = [event for event in events if event != exclude]
+        chosen = remaining[self._randrange(len(remaining))]
+        used.add(chosen)
+        return chosen
+
     def _maybe_trigger_endless_gimmick(self, enemy: Farm) -> None:
         assert self.player is not None
-        last_turn = getattr(enemy, 'last_gimmick_turn', -999)
-        if self.turn_count - last_turn < 3:
+        p = self.player
+        if self.turn_count - enemy.last_gimmick_turn < 3:
             return
 
-        base = 0.24 if isinstance(enemy, Boss) else 0.14
+        # bail out before computing the exact chance when the roll can't succeed:
+        # 0.42 is the highest possible chance (boss base 0.24 + 0.18 cap)
+        roll = self._rand()
+        if roll >= 0.42:
+            return
+        is_boss = isinstance(enemy, Boss)
+        base = 0.24 if is_boss else 0.14
         wave_scale = max(0, self.wave - STORY_END_WAVE)
         chance = base + min(0.18, wave_scale * 0.01)
-        if self.rng.random() >= chance:
+        if roll >= chance:
             return
 
-        if isinstance(enemy, Boss):
+        if is_boss:
             percent = 0.06 + min(0.12, wave_scale * 0.002)
             label = "Boss Siphon"
         else:
             percent = 0.04 + min(0.08, wave_scale * 0.0015)
             label = "Endless Hunger"
 
-        damage = max(1, round(self.player.max_hp * percent))
-        self.player.take_damage(damage)
+        damage = _percent_of_hp(p.max_hp, percent)
+        p.take_damage(damage)
         self.io.write(f"🔻 {enemy.name} triggers {label}, draining {damage} HP ({percent * 100:.1f}% of max)!")
-        setattr(enemy, 'last_gimmick_turn', self.turn_count)
+        enemy.last_gimmick_turn = self.turn_count
 
     def _event_pool(self) -> list[str]:
-        events = list(RANDOM_EVENTS) + list(BAD_EVENTS)
-        for wave_range, wave_events in WAVE_RANGE_EVENTS:
+        # the pool only depends on the wave; callers must not mutate the returned list
+        cached = self._event_pool_cache
+        if cached is not None and cached[0] == self.wave:
+            return cached[1]
+        events = list(_BASE_EVENTS)
+        idx = bisect.bisect_right(_WAVE_EVENT_STOPS, self.wave)
+        if idx < len(WAVE_RANGE_EVENTS):
+            wave_range, wave_events = WAVE_RANGE_EVENTS[idx]
             if self.wave in wave_range:
                 events.extend(wave_events)
-                break
+        self._event_pool_cache = (self.wave, events)
         return events
 
     def _event_scale(self) -> float:
@@ -989,151 +1208,196 @@ class Game:
         return min(2.0, 1.0 + extra * 0.03)
 
     def _scaled_percent(self, base: float) -> float:
-        return min(0.45, base * self._event_scale())
+        key = (self.wave, self.endless_mode)
+        if key != self._scaled_cache_key:
+            self._scaled_cache_key = key
+            self._scaled_cache = {}
+        scaled = self._scaled_cache.get(base)
+        if scaled is None:
+            scaled = self._scaled_cache[base] = min(0.45, base * self._event_scale())
+        return scaled
 
     def _apply_event(self, event: str) -> None:
-        event_map = {
-            "Mysterious Merchant": self._event_mysterious_merchant,
-            "Lightning Storm": self._event_lightning_storm,
-            "Lost Cow Returns": self._event_lost_cow,
-            "Strange Seed Sprouts": self._event_strange_seed,
-            "A Trap": self._event_trap,
-            "Wandering Bard": self._event_wandering_bard,
-            "Locust Swarm": self._event_locust_swarm,
-            "Irrigation Boom": self._event_irrigation_boom,
-            "Moonlit Harvest": self._event_moonlit_harvest,
-            "Butterfly Bloom": self._event_butterfly_bloom,
-            "Soggy Furrows": self._event_soggy_furrows,
-            "Cinder Drift": self._event_cinder_drift,
-            "Charred Fence": self._event_charred_fence,
-            "Gravel Gust": self._event_gravel_gust,
-            "Rusted Plow": self._event_rusted_plow,
-            "Sudden Hail": self._event_bad_event,
-            "Rusty Pitchfork": self._event_bad_event,
-            "Thorny Brambles": self._event_bad_event,
-        }
-        handler = event_map.get(event)
+        handler = self._EVENT_DISPATCH.get(event)
         if handler:
-            handler(event)
+            handler(self, event)
 
     def _event_mysterious_merchant(self, _: str) -> None:
-        if not self.player.merchant_skill_given:
-            self.io.write("A mysterious merchant offers you a new skill.")
-            self.player.add_new_skill(self.io)
-            self.player.merchant_skill_given = True
+        p = self.player
+        write = self.io.write
+        if not p.merchant_skill_given:
+            write("A mysterious merchant offers you a new skill.")
+            p.add_new_skill(self.io)
+            p.merchant_skill_given = True
         else:
-            coins = self.rng.randint(3, 6)
-            self.player.coins += coins
-            self.io.write(f"The merchant slips you {coins} coins in thanks.")
+            coins = self._randint(3, 6)
+            p.coins += coins
+            write(f"The merchant slips you {coins} coins in thanks.")
 
     def _event_lightning_storm(self, _: str) -> None:
-        self.io.write("A sudden lightning storm strikes your fields! You are hit.")
-        amount = self.player.damage_percent(self._scaled_percent(0.18))
-        self.io.write(f"{self.player.name} takes {amount} damage from the storm.")
+        p = self.player
+        write = self.io.write
+        write("A sudden lightning storm strikes your fields! You are hit.")
+        amount = p.damage_percent(self._scaled_percent(0.18))
+        write(f"{p.name} takes {amount} damage from the storm.")
 
     def _event_lost_cow(self, _: str) -> None:
-        self.io.write("A lost cow returns with a kind moo and licks your wounds.")
+        p = self.player
+        write = self.io.write
+        write("A lost cow returns with a kind moo and licks your wounds.")
         base_percent = self._scaled_percent(0.12)
         shield_percent = min(0.45, base_percent * 3)
-        shield = max(1, round(self.player.max_hp * shield_percent))
-        self.player.irrigation_shield = max(self.player.irrigation_shield, shield)
-        coins = self.rng.randint(1, 3)
-        self.player.coins += coins
-        self.io.write(
+        shield = _percent_of_hp(p.max_hp, shield_percent)
+        if shield > p.irrigation_shield:
+            p.irrigation_shield = shield
+        coins = self._randint(1, 3)
+        p.coins += coins
+        write(
             f"The cow's milk forms a gentle shield ({shield} damage absorbed, ~{shield_percent * 100:.1f}% of max) and you find {coins} coins in the pasture."
         )
 
     def _event_strange_seed(self, _: str) -> None:
-        self.io.write("A strange seed sprouts, making your farm heartier.")
+        p = self.player
+        write = self.io.write
+        write("A strange seed sprouts, making your farm heartier.")
         inc = 15
-        self.player.max_hp += inc
-        self.player.health += inc
-        self.io.write(f"Strange Seed: +{inc} max HP (now {self.player.max_hp}) and your health grows along with it.")
+        p.max_hp += inc
+        p.health += inc
+        write(f"Strange Seed: +{inc} max HP (now {p.max_hp}) and your health grows along with it.")
 
     def _event_trap(self, _: str) -> None:
-        self.io.write("A hidden trap snaps at your heels!")
-        amount = self.player.damage_percent(self._scaled_percent(0.2))
-        self.io.write(f"{self.player.name} takes {amount} damage and stumbles.")
+        p = self.player
+        write = self.io.write
+        write("A hidden trap snaps at your heels!")
+        amount = p.damage_percent(self._scaled_percent(0.2))
+        write(f"{p.name} takes {amount} damage and stumbles.")
 
     def _event_wandering_bard(self, _: str) -> None:
-        coins = self.rng.randint(3, 8)
-        self.player.coins += coins
-        self.io.write(f"A wandering bard sings of glory. You gain {coins} coins from compensation.")
+        p = self.player
+        write = self.io.write
+        coins = self._randint(3, 8)
+        p.coins += coins
+        write(f"A wandering bard sings of glory. You gain {coins} coins from compensation.")
 
     def _event_locust_swarm(self, _: str) -> None:
-        self.io.write("A locust swarm devours your crops farm.")
-        amount = self.player.damage_percent(self._scaled_percent(0.12))
-        self.io.write(f"{self.player.name} loses {amount} HP to exhaustion.")
+        p = self.player
+        write = self.io.write
+        write("A locust swarm devours your crops farm.")
+        amount = p.damage_percent(self._scaled_percent(0.12))
+        write(f"{p.name} loses {amount} HP to exhaustion.")
 
     def _event_irrigation_boom(self, _: str) -> None:
-        self.io.write("Fresh irrigation surges through your fields in a rushing tide.")
-        shield = max(1, round(self.player.max_hp * self._scaled_percent(0.1)))
-        self.player.irrigation_attack_turns = max(self.player.irrigation_attack_turns, 2)
-        self.player.irrigation_attack_bonus = max(self.player.irrigation_attack_bonus, 0.30)
-        self.player.irrigation_shield = max(self.player.irrigation_shield, shield)
-        self.io.write("Overflow Surge: next 2 attacks deal +30% damage.")
-        self.io.write(f"A water shield forms for {shield} damage.")
+        p = self.player
+        write = self.io.write
+        write("Fresh irrigation surges through your fields in a rushing tide.")
+        shield = _percent_of_hp(p.max_hp, self._scaled_percent(0.1))
+        if p.irrigation_attack_turns < 2:
+            p.irrigation_attack_turns = 2
+        if p.irrigation_attack_bonus < 0.30:
+            p.irrigation_attack_bonus = 0.30
+        if shield > p.irrigation_shield:
+            p.irrigation_shield = shield
+        write("Overflow Surge: next 2 attacks deal +30% damage.")
+        write(f"A water shield forms for {shield} damage.")
 
     def _event_moonlit_harvest(self, _: str) -> None:
-        coins = self.rng.randint(2, 5)
-        self.player.coins += coins
+        p = self.player
+        write = self.io.write
+        coins = self._randint(2, 5)
+        p.coins += coins
         gold_chance = min(0.6, 0.35 * self._event_scale())
-        if self.rng.random() < gold_chance:
-            self.player.gold += 1
-            self.io.write("The Moonlight reveals a hidden gold nugget!")
-        self.io.write(f"You harvest {coins} coins under the moon.")
+        if self._rand() < gold_chance:
+            p.gold += 1
+            write("The Moonlight reveals a hidden gold nugget!")
+        write(f"You harvest {coins} coins under the moon.")
 
     def _event_butterfly_bloom(self, _: str) -> None:
-        self.io.write("Butterflies swirl around your farm, stirring a fierce resolve.")
-        coins = self.rng.randint(2, 5)
-        self.player.coins += coins
+        p = self.player
+        write = self.io.write
+        write("Butterflies swirl around your farm, stirring a fierce resolve.")
+        coins = self._randint(2, 5)
+        p.coins += coins
         bonus = 3
-        self.player.attack_power += bonus
-        self.player.temp_attack_bonus += bonus
-        self.io.write(f"You find {coins} coins and gain +{bonus} attack for this wave.")
+        p.attack_power += bonus
+        p.temp_attack_bonus += bonus
+        write(f"You find {coins} coins and gain +{bonus} attack for this wave.")
 
     def _event_soggy_furrows(self, _: str) -> None:
-        self.io.write("Soggy furrows slow you down.")
-        amount = self.player.damage_percent(self._scaled_percent(0.1))
-        self.io.write(f"You slog through and lose {amount} HP.")
+        p = self.player
+        write = self.io.write
+        write("Soggy furrows slow you down.")
+        amount = p.damage_percent(self._scaled_percent(0.1))
+        write(f"You slog through and lose {amount} HP.")
 
     def _event_cinder_drift(self, _: str) -> None:
-        self.io.write("Cinder drift coats the crops in ash.")
-        amount = self.player.damage_percent(self._scaled_percent(0.14))
-        self.io.write(f"Heat drains {amount} HP.")
+        p = self.player
+        write = self.io.write
+        write("Cinder drift coats the crops in ash.")
+        amount = p.damage_percent(self._scaled_percent(0.14))
+        write(f"Heat drains {amount} HP.")
 
     def _event_charred_fence(self, _: str) -> None:
-        self.io.write("A charred fence collapses—repair costs mount.")
-        coins = self.rng.randint(2, 4)
-        self.player.coins = max(0, self.player.coins - coins)
-        self.io.write(f"You spend {coins} coins on repairs.")
+        p = self.player
+        write = self.io.write
+        write("A charred fence collapses—repair costs mount.")
+        coins = self._randint(2, 4)
+        p.coins = max(0, p.coins - coins)
+        write(f"You spend {coins} coins on repairs.")
 
     def _event_gravel_gust(self, _: str) -> None:
-        self.io.write("A gravel gust whips across the ridge.")
-        amount = self.player.damage_percent(self._scaled_percent(0.1))
-        self.io.write(f"You take {amount} damage.")
+        p = self.player
+        write = self.io.write
+        write("A gravel gust whips across the ridge.")
+        amount = p.damage_percent(self._scaled_percent(0.1))
+        write(f"You take {amount} damage.")
 
     def _event_rusted_plow(self, _: str) -> None:
-        self.io.write("You salvage a rusted plow for scrap.")
-        coins = self.rng.randint(3, 6)
-        self.player.coins += coins
-        self.io.write(f"You gain {coins} coins.")
+        p = self.player
+        write = self.io.write
+        write("You salvage a rusted plow for scrap.")
+        coins = self._randint(3, 6)
+        p.coins += coins
+        write(f"You gain {coins} coins.")
 
     def _event_bad_event(self, event: str) -> None:
+        p = self.player
+        write = self.io.write
         cleaned = event.strip()
-        self.io.write(f"⚠️ {cleaned}!")
+        write(f"⚠️ {cleaned}!")
         if cleaned == "Sudden Hail":
-            amount = self.player.damage_percent(self._scaled_percent(0.12))
-            self.io.write(f"Hail pummels your roof. You take {amount} damage.")
+            amount = p.damage_percent(self._scaled_percent(0.12))
+            write(f"Hail pummels your roof. You take {amount} damage.")
         elif cleaned == "Rusty Pitchfork":
-            amount = self.player.damage_percent(self._scaled_percent(0.1))
-            self.io.write(f"You nick yourself on a rusty pitchfork. -{amount} HP.")
+            amount = p.damage_percent(self._scaled_percent(0.1))
+            write(f"You nick yourself on a rusty pitchfork. -{amount} HP.")
         elif cleaned == "Thorny Brambles":
-            amount = self.player.damage_percent(self._scaled_percent(0.08))
-            self.io.write(f"Brambles scratch you up. -{amount} HP.")
+            amount = p.damage_percent(self._scaled_percent(0.08))
+            write(f"Brambles scratch you up. -{amount} HP.")
         else:
-            amount = self.player.damage_percent(self._scaled_percent(0.1))
-            self.io.write(f"{cleaned} leaves you battered. -{amount} HP.")
+            amount = p.damage_percent(self._scaled_percent(0.1))
+            write(f"{cleaned} leaves you battered. -{amount} HP.")
+
+    # event name -> handler, built once with the plain functions defined above
+    _EVENT_DISPATCH: dict[str, Callable[["Game", str], None]] = {
+        "Mysterious Merchant": _event_mysterious_merchant,
+        "Lightning Storm": _event_lightning_storm,
+        "Lost Cow Returns": _event_lost_cow,
+        "Strange Seed Sprouts": _event_strange_seed,
+        "A Trap": _event_trap,
+        "Wandering Bard": _event_wandering_bard,
+        "Locust Swarm": _event_locust_swarm,
+        "Irrigation Boom": _event_irrigation_boom,
+        "Moonlit Harvest": _event_moonlit_harvest,
+        "Butterfly Bloom": _event_butterfly_bloom,
+        "Soggy Furrows": _event_soggy_furrows,
+        "Cinder Drift": _event_cinder_drift,
+        "Charred Fence": _event_charred_fence,
+        "Gravel Gust": _event_gravel_gust,
+        "Rusted Plow": _event_rusted_plow,
+        "Sudden Hail": _event_bad_event,
+        "Rusty Pitchfork": _event_bad_event,
+        "Thorny Brambles": _event_bad_event,
+    }
 
 def main() -> None:
     game = Game()
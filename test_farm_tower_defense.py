@@ -0,0 +1,85 @@
+import random
+import unittest
+
+from farm_tower_defense import ENDLESS_SHOP, Game, PlayerFarm, ScriptedIO, WAVE_RANGE_EVENTS
+
+
+def _fired_events(io: ScriptedIO) -> list[str]:
+    prefix = "✨ Random Event: "
+    return [
+        text.strip()[len(prefix):-1]
+        for text in io.outputs
+        if text.strip().startswith(prefix)
+    ]
+
+
+class RandomEventPoolTest(unittest.TestCase):
+    def test_wave_range_events_follow_current_area(self) -> None:
+        early_events = set(WAVE_RANGE_EVENTS[0][1])
+        mid_events = set(WAVE_RANGE_EVENTS[1][1])
+        fired_at_wave_12: set[str] = set()
+        for seed in range(100):
+            io = ScriptedIO()
+            game = Game(io=io, rng=random.Random(seed))
+            game.player = PlayerFarm("Test")
+            game.player.rng = random.Random(seed)
+            # start the event cycle in the 1-10 range, then move into 11-20
+            for wave in (3, 6, 9, 12):
+                game.wave = wave
+                io.outputs.clear()
+                game._trigger_random_event()
+            fired_at_wave_12.update(_fired_events(io))
+
+        self.assertTrue(fired_at_wave_12 & mid_events)
+        self.assertFalse(fired_at_wave_12 & early_events)
+
+
+class ShopTest(unittest.TestCase):
+    def _shop(self, inputs: list[str], endless: bool = False) -> tuple[Game, ScriptedIO]:
+        io = ScriptedIO([*inputs, "6"])
+        game = Game(io=io, rng=random.Random(0))
+        game.player = PlayerFarm("Test")
+        game.endless_mode = endless
+        return game, io
+
+    def test_coin_purchase(self) -> None:
+        game, io = self._shop(["2"])
+        p = game.player
+        p.coins = 10
+        game._open_shop()
+        self.assertEqual(p.coins, 4)
+        self.assertEqual(p.attack_power, 37)
+        self.assertEqual(p.temp_attack_bonus, 12)
+        self.assertIn("You drink the Attack Tonic. Attack +12 for this wave.", io.outputs)
+        self.assertIn("Coins: 4 | Gold: 0", io.outputs)
+
+    def test_gold_purchase_without_gold_shows_tip_once(self) -> None:
+        game, io = self._shop(["4", "4"])
+        p = game.player
+        game._open_shop()
+        self.assertEqual(io.outputs.count("Not enough gold."), 2)
+        self.assertEqual(io.outputs.count("Tip: Buy a Gold Pouch with coins to get gold."), 1)
+        self.assertEqual(p.attack_power, 25)
+        self.assertEqual(p.max_hp, 150)
+
+    def test_tonic_is_blocked_while_active(self) -> None:
+        game, io = self._shop(["1", "1"])
+        p = game.player
+        p.coins = 20
+        game._open_shop()
+        self.assertEqual(p.coins, 12)
+        self.assertEqual(p.tonic_turns, 3)
+        self.assertEqual(io.outputs.count("This item is still in effect, buy a different one."), 1)
+
+    def test_endless_mode_uses_endless_table(self) -> None:
+        game, io = self._shop(["3"], endless=True)
+        p = game.player
+        p.coins = 20
+        game._open_shop()
+        self.assertEqual(p.coins, 5)
+        self.assertEqual(p.gold, 2)
+        self.assertIn(ENDLESS_SHOP["3"].message, io.outputs)
+
+
+if __name__ == "__main__":
+    unittest.main()